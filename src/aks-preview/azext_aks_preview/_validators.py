@@ -11,7 +11,6 @@ import re
 from ipaddress import ip_network
 from math import isclose, isnan
 
-import azure.cli.core.keys as keys
 from azure.cli.core.azclierror import (
     ArgumentUsageError,
     InvalidArgumentValueError,
@@ -21,6 +20,7 @@ from azure.cli.core.azclierror import (
 from azure.cli.core.commands.validators import validate_tag
 from azure.cli.core.util import CLIError
 from knack.log import get_logger
+from msrestazure.tools import is_valid_resource_id
 
 from azext_aks_preview._consts import (
     ADDONS,
@@ -31,18 +31,52 @@ from azext_aks_preview._helpers import _fuzzy_match
 
 logger = get_logger(__name__)
 
+# https://stackoverflow.com/questions/106179/regular-expression-to-match-dns-hostname-or-ip-address
+_re_rfc1123 = re.compile(
+    r'^([a-zA-Z0-9]|[a-zA-Z0-9][a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])(\.([a-zA-Z0-9]|[a-zA-Z0-9][a-zA-Z0-9\-]{0,61}[a-zA-Z0-9]))*$')  # pylint:disable=line-too-long
+_re_taint = re.compile(
+    r"^[a-zA-Z\d][\w\-\.\/]{0,252}=[a-zA-Z\d][\w\-\.]{0,62}:(NoSchedule|PreferNoSchedule|NoExecute)$")  # pylint: disable=line-too-long
+_restrict_traffic_to_agentnodes = "0.0.0.0/32"
+_allow_all_traffic = ""
+_ip_range_sentinels = frozenset((_restrict_traffic_to_agentnodes, _allow_all_traffic))
+_re_nodepool_name = re.compile(r'^[a-zA-Z0-9]{1,12}\Z')
+_taint_effects = frozenset(("NoSchedule", "PreferNoSchedule", "NoExecute"))
+_re_label_prefix = re.compile(r"^[a-z0-9]([-a-z0-9]*[a-z0-9])?(\.[a-z0-9]([-a-z0-9]*[a-z0-9])?)*$")
+_re_label_name = re.compile(r"^([A-Za-z0-9][-A-Za-z0-9_.]*)?[A-Za-z0-9]$")
+_re_label_value = re.compile(r"^(([A-Za-z0-9][-A-Za-z0-9_.]*)?[A-Za-z0-9])?$")
+_vm_set_types = frozenset(("availabilityset", "virtualmachinescalesets"))
+_load_balancer_skus = frozenset(("basic", "standard"))
+_credential_users = frozenset(("clusteruser", "clustermonitoringuser"))
+_all_addons = list(ADDONS)
+_all_addons_str = str(_all_addons)[1:-1]
+# a ksm metric allow list is a comma separated list of "name=[value,...]" groups,
+# the metric name is checked in the same pass so a bad name fails as soon as it is reached
+_ksm_metric_group = r'[a-zA-Z_][A-Za-z0-9_]+=\[(?:[^=,\[\]]+(?:,[^=,\[\]]+)*)?\]'
+_re_ksm_metric_groups = re.compile(r'(?:{0}(?:,{0})*)?'.format(_ksm_metric_group))
+_ksm_metric_format_error = (
+    "Please format --metric properly. For eg. : --ksm-metric-labels-allow-list \"=namespaces=[k8s-label-1,k8s-label-n,...],pods=[app],...)\" "  # pylint:disable=line-too-long
+    "and --ksm-metric-annotations-allow-list \"namespaces=[kubernetes.io/team,...],pods=[kubernetes.io/team],...\"")
+
 
 def validate_ssh_key(namespace):
     if hasattr(namespace, 'no_ssh_key') and namespace.no_ssh_key:
         return
+    import azure.cli.core.keys as keys
+
     string_or_file = (namespace.ssh_key_value or
                       os.path.join(os.path.expanduser('~'), '.ssh', 'id_rsa.pub'))
+    # an inline key value doesn't need a filesystem lookup
+    is_inline_value = string_or_file.startswith('ssh-')
+    if is_inline_value and keys.is_valid_ssh_rsa_public_key(string_or_file):
+        namespace.ssh_key_value = string_or_file
+        return
     content = string_or_file
     if os.path.exists(string_or_file):
         logger.info('Use existing SSH public key file: %s', string_or_file)
         with open(string_or_file, 'r') as f:
             content = f.read()
-    elif not keys.is_valid_ssh_rsa_public_key(content):
+    # an inline value reaching here has already failed the key check
+    elif is_inline_value or not keys.is_valid_ssh_rsa_public_key(content):
         if namespace.generate_ssh_keys:
             # figure out appropriate file names:
             # 'base_name'(with private keys), and 'base_name.pub'(with public keys)
@@ -75,10 +109,12 @@ def validate_k8s_version(namespace):
     """Validates a string as a possible Kubernetes version. An empty string is also valid, which tells the server
     to use its default version."""
     if namespace.kubernetes_version:
-        k8s_release_regex = re.compile(r'^[v|V]?(\d+\.\d+(?:\.\d+)?)$')
-        found = k8s_release_regex.findall(namespace.kubernetes_version)
-        if found:
-            namespace.kubernetes_version = found[0]
+        version = namespace.kubernetes_version
+        if version[0] in ('v', 'V'):
+            version = version[1:]
+        parts = version.split('.')
+        if len(parts) in (2, 3) and all(part.isdecimal() for part in parts):
+            namespace.kubernetes_version = version
         else:
             raise CLIError('--kubernetes-version should be the full version number or alias minor version, '
                            'such as "1.7.12" or "1.7"')
@@ -91,11 +127,7 @@ def validate_linux_host_name(namespace):
     a minute or two before the user sees it. So it's more user-friendly to validate
     in the CLI pre-flight.
     """
-    # https://stackoverflow.com/questions/106179/regular-expression-to-match-dns-hostname-or-ip-address
-    rfc1123_regex = re.compile(
-        r'^([a-zA-Z0-9]|[a-zA-Z0-9][a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])(\.([a-zA-Z0-9]|[a-zA-Z0-9][a-zA-Z0-9\-]{0,61}[a-zA-Z0-9]))*$')  # pylint:disable=line-too-long
-    found = rfc1123_regex.findall(namespace.name)
-    if not found:
+    if len(namespace.name) > 63 or not _re_rfc1123.match(namespace.name):
         raise CLIError('--name cannot exceed 63 characters and can only contain '
                        'letters, numbers, or dashes (-).')
 
@@ -114,42 +146,39 @@ def validate_ip_ranges(namespace):
     if not namespace.api_server_authorized_ip_ranges:
         return
 
-    restrict_traffic_to_agentnodes = "0.0.0.0/32"
-    allow_all_traffic = ""
     ip_ranges = [ip.strip()
                  for ip in namespace.api_server_authorized_ip_ranges.split(",")]
 
-    if restrict_traffic_to_agentnodes in ip_ranges and len(ip_ranges) > 1:
+    if _restrict_traffic_to_agentnodes in ip_ranges and len(ip_ranges) > 1:
         raise CLIError(("Setting --api-server-authorized-ip-ranges to 0.0.0.0/32 is not allowed with other IP ranges."
                         "Refer to https://aka.ms/aks/whitelist for more details"))
 
-    if allow_all_traffic in ip_ranges and len(ip_ranges) > 1:
+    if _allow_all_traffic in ip_ranges and len(ip_ranges) > 1:
         raise CLIError(
             "--api-server-authorized-ip-ranges cannot be disabled and simultaneously enabled")
 
     for ip in ip_ranges:
-        if ip in [restrict_traffic_to_agentnodes, allow_all_traffic]:
+        if ip in _ip_range_sentinels:
             continue
         try:
             ip = ip_network(ip)
-            if not ip.is_global:
-                raise CLIError(
-                    "--api-server-authorized-ip-ranges must be global non-reserved addresses or CIDRs")
-            if ip.version == 6:
-                raise CLIError(
-                    "--api-server-authorized-ip-ranges cannot be IPv6 addresses")
         except ValueError:
             raise CLIError(
                 "--api-server-authorized-ip-ranges should be a list of IPv4 addresses or CIDRs")
+        if not ip.is_global:
+            raise CLIError(
+                "--api-server-authorized-ip-ranges must be global non-reserved addresses or CIDRs")
+        if ip.version == 6:
+            raise CLIError(
+                "--api-server-authorized-ip-ranges cannot be IPv6 addresses")
 
 
 def _validate_nodepool_name(nodepool_name):
     """Validates a nodepool name to be at most 12 characters, alphanumeric only."""
-    if nodepool_name != "":
+    if nodepool_name != "" and not _re_nodepool_name.match(nodepool_name):
         if len(nodepool_name) > 12:
             raise InvalidArgumentValueError('--nodepool-name can contain at most 12 characters')
-        if not nodepool_name.isalnum():
-            raise InvalidArgumentValueError('--nodepool-name should contain only alphanumeric characters')
+        raise InvalidArgumentValueError('--nodepool-name should contain only alphanumeric characters')
 
 
 def validate_nodepool_name(namespace):
@@ -167,8 +196,7 @@ def validate_vm_set_type(namespace):
     if namespace.vm_set_type is not None:
         if namespace.vm_set_type == '':
             return
-        if namespace.vm_set_type.lower() != "availabilityset" and \
-                namespace.vm_set_type.lower() != "virtualmachinescalesets":
+        if namespace.vm_set_type.lower() not in _vm_set_types:
             raise CLIError(
                 "--vm-set-type can only be VirtualMachineScaleSets or AvailabilitySet")
 
@@ -178,7 +206,7 @@ def validate_load_balancer_sku(namespace):
     if namespace.load_balancer_sku is not None:
         if namespace.load_balancer_sku == '':
             return
-        if namespace.load_balancer_sku.lower() != "basic" and namespace.load_balancer_sku.lower() != "standard":
+        if namespace.load_balancer_sku.lower() not in _load_balancer_skus:
             raise CLIError("--load-balancer-sku can only be standard or basic")
 
 
@@ -204,16 +232,13 @@ def validate_load_balancer_outbound_ip_prefixes(namespace):
 
 def validate_taints(namespace):
     """Validates that provided taint is a valid format"""
-
-    regex = re.compile(
-        r"^[a-zA-Z\d][\w\-\.\/]{0,252}=[a-zA-Z\d][\w\-\.]{0,62}:(NoSchedule|PreferNoSchedule|NoExecute)$")  # pylint: disable=line-too-long
-
     if namespace.node_taints is not None and namespace.node_taints != '':
+        match_taint = _re_taint.match
         for taint in namespace.node_taints.split(','):
             if taint == "":
                 continue
-            found = regex.findall(taint)
-            if not found:
+            key_value, _, effect = taint.rpartition(':')
+            if effect not in _taint_effects or '=' not in key_value or not match_taint(taint):
                 raise CLIError('Invalid node taint: %s' % taint)
 
 
@@ -244,7 +269,8 @@ def validate_spot_max_price(namespace):
         if namespace.priority != "Spot":
             raise CLIError(
                 "--spot_max_price can only be set when --priority is Spot")
-        if len(str(namespace.spot_max_price).split(".")) > 1 and len(str(namespace.spot_max_price).split(".")[1]) > 5:
+        price_parts = str(namespace.spot_max_price).split(".", 1)
+        if len(price_parts) > 1 and len(price_parts[1]) > 5:
             raise CLIError(
                 "--spot_max_price can only include up to 5 decimal places")
         if namespace.spot_max_price <= 0 and not isclose(namespace.spot_max_price, -1.0, rel_tol=1e-06):
@@ -268,8 +294,7 @@ def validate_acr(namespace):
 
 
 def validate_user(namespace):
-    if namespace.user.lower() != "clusteruser" and \
-            namespace.user.lower() != "clustermonitoringuser":
+    if namespace.user.lower() not in _credential_users:
         raise CLIError(
             "--user can only be clusterUser or clusterMonitoringUser")
 
@@ -289,7 +314,6 @@ def validate_apiserver_subnet_id(namespace):
 def _validate_subnet_id(subnet_id, name):
     if subnet_id is None or subnet_id == '':
         return
-    from msrestazure.tools import is_valid_resource_id
     if not is_valid_resource_id(subnet_id):
         raise CLIError(name + " is not a valid Azure resource ID.")
 
@@ -357,13 +381,7 @@ def validate_nodepool_labels(namespace):
     if labels is None:
         return
 
-    if isinstance(labels, list):
-        labels_dict = {}
-        for item in labels:
-            labels_dict.update(validate_label(item))
-        after_validation_labels = labels_dict
-    else:
-        after_validation_labels = validate_label(labels)
+    after_validation_labels = _validate_labels(labels)
 
     if hasattr(namespace, 'nodepool_labels'):
         namespace.nodepool_labels = after_validation_labels
@@ -371,20 +389,25 @@ def validate_nodepool_labels(namespace):
         namespace.labels = after_validation_labels
 
 
+def _validate_labels(labels):
+    """Validates a single label or a list of labels and merges them into one dict"""
+    if not isinstance(labels, list):
+        return validate_label(labels)
+    labels_dict = {}
+    for item in labels:
+        labels_dict.update(validate_label(item))
+    return labels_dict
+
+
 def validate_label(label):
     """Validates that provided label is a valid format"""
-    prefix_regex = re.compile(
-        r"^[a-z0-9]([-a-z0-9]*[a-z0-9])?(\.[a-z0-9]([-a-z0-9]*[a-z0-9])?)*$")
-    name_regex = re.compile(r"^([A-Za-z0-9][-A-Za-z0-9_.]*)?[A-Za-z0-9]$")
-    value_regex = re.compile(r"^(([A-Za-z0-9][-A-Za-z0-9_.]*)?[A-Za-z0-9])?$")
-
     if label == "":
         return {}
-    kv = label.split('=')
-    if len(kv) != 2:
+    if label.count('=') != 1:
         raise CLIError(
             "Invalid label: %s. Label definition must be of format name=value." % label)
-    name_parts = kv[0].split('/')
+    key, _, value = label.partition('=')
+    name_parts = key.split('/')
     if len(name_parts) == 1:
         name = name_parts[0]
     elif len(name_parts) == 2:
@@ -392,7 +415,7 @@ def validate_label(label):
         if not prefix or len(prefix) > 253:
             raise CLIError(
                 "Invalid label: %s. Label prefix can't be empty or more than 253 chars." % label)
-        if not prefix_regex.match(prefix):
+        if not _re_label_prefix.match(prefix):
             raise CLIError("Invalid label: %s. Prefix part a DNS-1123 label must consist of lower case alphanumeric "
                            "characters or '-', and must start and end with an alphanumeric character" % label)
         name = name_parts[1]
@@ -406,43 +429,44 @@ def validate_label(label):
     if not name or len(name) > 63:
         raise CLIError(
             "Invalid label: %s. Label name can't be empty or more than 63 chars." % label)
-    if not name_regex.match(name):
+    if not _re_label_name.match(name):
         raise CLIError("Invalid label: %s. A qualified name must consist of alphanumeric characters, '-', '_' "
                        "or '.', and must start and end with an alphanumeric character (e.g. 'MyName',  or "
                        "'my.name',  or '123-abc') with an optional DNS subdomain prefix and '/' (e.g. "
                        "'example.com/MyName')" % label)
 
     # validate label value
-    if len(kv[1]) > 63:
+    if len(value) > 63:
         raise CLIError(
             "Invalid label: %s. Label must be more than 63 chars." % label)
-    if not value_regex.match(kv[1]):
+    if not _re_label_value.match(value):
         raise CLIError("Invalid label: %s. A valid label must be an empty string or consist of alphanumeric "
                        "characters, '-', '_' or '.', and must start and end with an alphanumeric character" % label)
 
-    return {kv[0]: kv[1]}
+    return {key: value}
 
 
 def validate_max_surge(namespace):
-    """validates parameters like max surge are positive integers or percents. less strict than RP"""
+    """validates parameters like max surge are non-negative integers or percents written as plain digits"""
     if namespace.max_surge is None:
         return
     int_or_percent = namespace.max_surge
     if int_or_percent.endswith('%'):
         int_or_percent = int_or_percent.rstrip('%')
 
-    try:
-        if int(int_or_percent) < 0:
+    if int_or_percent.isdecimal():
+        return
+    if int_or_percent.startswith('-') and int_or_percent[1:].isdecimal():
+        if int(int_or_percent[1:]) > 0:
             raise CLIError("--max-surge must be positive")
-    except ValueError:
-        raise CLIError("--max-surge should be an int or percentage")
+        return
+    raise CLIError("--max-surge should be an int or percentage")
 
 
 def validate_assign_identity(namespace):
     if namespace.assign_identity is not None:
         if namespace.assign_identity == '':
             return
-        from msrestazure.tools import is_valid_resource_id
         if not is_valid_resource_id(namespace.assign_identity):
             raise CLIError(
                 "--assign-identity is not a valid Azure resource ID.")
@@ -451,16 +475,14 @@ def validate_assign_identity(namespace):
 def _recognize_addons(addon_args):
     for addon_arg in addon_args:
         if addon_arg not in ADDONS:
-            matches = _fuzzy_match(addon_arg, list(ADDONS))
+            matches = _fuzzy_match(addon_arg, _all_addons)
             matches = str(matches)[1:-1]
-            all_addons = list(ADDONS)
-            all_addons = str(all_addons)[1:-1]
             if not matches:
                 raise CLIError(
-                    f"The addon \"{addon_arg}\" is not a recognized addon option. Possible options: {all_addons}")
+                    f"The addon \"{addon_arg}\" is not a recognized addon option. Possible options: {_all_addons_str}")
 
             raise CLIError(
-                f"The addon \"{addon_arg}\" is not a recognized addon option. Did you mean {matches}? Possible options: {all_addons}")  # pylint:disable=line-too-long
+                f"The addon \"{addon_arg}\" is not a recognized addon option. Did you mean {matches}? Possible options: {_all_addons_str}")  # pylint:disable=line-too-long
 
 
 def validate_addon(namespace):
@@ -490,15 +512,7 @@ def validate_pod_identity_pod_labels(namespace):
         namespace.pod_labels = {}
         return
 
-    if isinstance(labels, list):
-        labels_dict = {}
-        for item in labels:
-            labels_dict.update(validate_label(item))
-        after_validation_labels = labels_dict
-    else:
-        after_validation_labels = validate_label(labels)
-
-    namespace.pod_labels = after_validation_labels
+    namespace.pod_labels = _validate_labels(labels)
 
 
 def validate_pod_identity_resource_name(attr_name, required):
@@ -535,7 +549,6 @@ def validate_assign_kubelet_identity(namespace):
     if namespace.assign_kubelet_identity is not None:
         if namespace.assign_kubelet_identity == '':
             return
-        from msrestazure.tools import is_valid_resource_id
         if not is_valid_resource_id(namespace.assign_kubelet_identity):
             raise CLIError(
                 "--assign-kubelet-identity is not a valid Azure resource ID.")
@@ -543,23 +556,18 @@ def validate_assign_kubelet_identity(namespace):
 
 def validate_snapshot_name(namespace):
     """Validates a nodepool snapshot name to be alphanumeric and dashes."""
-    rfc1123_regex = re.compile(
-        r'^([a-zA-Z0-9]|[a-zA-Z0-9][a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])(\.([a-zA-Z0-9]|[a-zA-Z0-9][a-zA-Z0-9\-]{0,61}[a-zA-Z0-9]))*$')  # pylint:disable=line-too-long
-    found = rfc1123_regex.findall(namespace.snapshot_name)
-    if not found:
+    if len(namespace.snapshot_name) > 63 or not _re_rfc1123.match(namespace.snapshot_name):
         raise InvalidArgumentValueError('--name cannot exceed 63 characters and can only contain '
                                         'letters, numbers, or dashes (-).')
 
 
 def validate_nodepool_id(namespace):
-    from msrestazure.tools import is_valid_resource_id
     if not is_valid_resource_id(namespace.nodepool_id):
         raise InvalidArgumentValueError(
             "--nodepool-id is not a valid Azure resource ID.")
 
 
 def validate_cluster_id(namespace):
-    from msrestazure.tools import is_valid_resource_id
     if not is_valid_resource_id(namespace.cluster_id):
         raise InvalidArgumentValueError(
             "--cluster-id is not a valid Azure resource ID.")
@@ -567,7 +575,6 @@ def validate_cluster_id(namespace):
 
 def validate_snapshot_id(namespace):
     if namespace.snapshot_id:
-        from msrestazure.tools import is_valid_resource_id
         if not is_valid_resource_id(namespace.snapshot_id):
             raise InvalidArgumentValueError(
                 "--snapshot-id is not a valid Azure resource ID.")
@@ -575,7 +582,6 @@ def validate_snapshot_id(namespace):
 
 def validate_cluster_snapshot_id(namespace):
     if namespace.cluster_snapshot_id:
-        from msrestazure.tools import is_valid_resource_id
         if not is_valid_resource_id(namespace.cluster_snapshot_id):
             raise InvalidArgumentValueError(
                 "--cluster-snapshot-id is not a valid Azure resource ID.")
@@ -583,7 +589,6 @@ def validate_cluster_snapshot_id(namespace):
 
 def validate_host_group_id(namespace):
     if namespace.host_group_id:
-        from msrestazure.tools import is_valid_resource_id
         if not is_valid_resource_id(namespace.host_group_id):
             raise InvalidArgumentValueError(
                 "--host-group-id is not a valid Azure resource ID.")
@@ -591,7 +596,6 @@ def validate_host_group_id(namespace):
 
 def validate_crg_id(namespace):
     if namespace.crg_id:
-        from msrestazure.tools import is_valid_resource_id
         if not is_valid_resource_id(namespace.crg_id):
             raise InvalidArgumentValueError(
                 "--crg-id is not a valid Azure resource ID.")
@@ -616,7 +620,6 @@ def validate_azure_keyvault_kms_key_vault_resource_id(namespace):
     key_vault_resource_id = namespace.azure_keyvault_kms_key_vault_resource_id
     if key_vault_resource_id is None or key_vault_resource_id == '':
         return
-    from msrestazure.tools import is_valid_resource_id
     if not is_valid_resource_id(key_vault_resource_id):
         raise InvalidArgumentValueError("--azure-keyvault-kms-key-vault-resource-id is not a valid Azure resource ID.")
 
@@ -650,12 +653,19 @@ def validate_defender_disable_and_enable_parameters(namespace):
 
 
 def sanitize_resource_id(resource_id):
-    resource_id = resource_id.strip()
+    resource_id = resource_id.strip().rstrip("/").lower()
     if not resource_id.startswith("/"):
         resource_id = "/" + resource_id
-    if resource_id.endswith("/"):
-        resource_id = resource_id.rstrip("/")
-    return resource_id.lower()
+    return resource_id
+
+
+def _is_resource_id_of_type(resource_id, provider, resource_type):
+    """Checks that a sanitized resource id has the form
+    /subscriptions/<sub>/resourcegroups/<rg>/providers/<provider>/<resource_type>/<name>"""
+    parts = resource_id.split("/")
+    return (len(parts) == 9 and parts[1] == "subscriptions" and parts[3] == "resourcegroups" and
+            parts[5] == "providers" and parts[6] == provider and parts[7] == resource_type and
+            all(parts[2::2]))
 
 
 def validate_azuremonitorworkspaceresourceid(namespace):
@@ -663,7 +673,7 @@ def validate_azuremonitorworkspaceresourceid(namespace):
     if resource_id is None:
         return
     resource_id = sanitize_resource_id(resource_id)
-    if (bool(re.match(r'/subscriptions/.*/resourcegroups/.*/providers/microsoft.monitor/accounts/.*', resource_id))) is False:
+    if not _is_resource_id_of_type(resource_id, "microsoft.monitor", "accounts"):
         raise ArgumentUsageError("--azure-monitor-workspace-resource-id not in the correct format. It should match `/subscriptions/<subscriptionId>/resourceGroups/<resourceGroupName>/providers/microsoft.monitor/accounts/<resourceName>`")
 
 
@@ -672,62 +682,24 @@ def validate_grafanaresourceid(namespace):
     if resource_id is None:
         return
     resource_id = sanitize_resource_id(resource_id)
-    if (bool(re.match(r'/subscriptions/.*/resourcegroups/.*/providers/microsoft.dashboard/grafana/.*', resource_id))) is False:
+    if not _is_resource_id_of_type(resource_id, "microsoft.dashboard", "grafana"):
         raise ArgumentUsageError("--grafana-resource-id not in the correct format. It should match `/subscriptions/<subscriptionId>/resourceGroups/<resourceGroupName>/providers/microsoft.dashboard/grafana/<resourceName>`")
 
 
 def validate_ksm_parameter(ksmparam):
-    labelValueMap = {}
-    ksmStrLength = len(ksmparam)
-    EOF = -1
-    next = ""
-    name = ""
-    firstWordPos = 0
-    for i, v in enumerate(ksmparam):
-        if i + 1 == ksmStrLength:
-            next = EOF
-        else:
-            next = ord(ksmparam[i + 1])
-        if i - 1 >= 0:
-            previous = ord(ksmparam[i - 1])
-        else:
-            previous = v
-        if v == "=":
-            if previous == ord(",") or next != ord("["):
-                raise InvalidArgumentValueError("Please format --metric properly. For eg. : --ksm-metric-labels-allow-list \"=namespaces=[k8s-label-1,k8s-label-n,...],pods=[app],...)\" and --ksm-metric-annotations-allow-list \"namespaces=[kubernetes.io/team,...],pods=[kubernetes.io/team],...\"")
-            name = ksmparam[firstWordPos:i]
-            labelValueMap[name] = []
-            firstWordPos = i + 1
-        elif v == "[":
-            if previous != ord("="):
-                raise InvalidArgumentValueError("Please format --metric properly. For eg. : --ksm-metric-labels-allow-list \"=namespaces=[k8s-label-1,k8s-label-n,...],pods=[app],...)\" and --ksm-metric-annotations-allow-list \"namespaces=[kubernetes.io/team,...],pods=[kubernetes.io/team],...\"")
-            firstWordPos = i + 1
-        elif v == "]":
-            # if after metric group, has char not comma or end.
-            if next != EOF and next != ord(","):
-                raise InvalidArgumentValueError("Please format --metric properly. For eg. : --ksm-metric-labels-allow-list \"=namespaces=[k8s-label-1,k8s-label-n,...],pods=[app],...)\" and --ksm-metric-annotations-allow-list \"namespaces=[kubernetes.io/team,...],pods=[kubernetes.io/team],...\"")
-            if previous != ord("["):
-                labelValueMap[name].append(ksmparam[firstWordPos:i])
-            firstWordPos = i + 1
-        elif v == ",":
-            # if starts or ends with comma
-            if previous == v or next == EOF or next == ord("]"):
-                raise InvalidArgumentValueError("Please format --metric properly. For eg. : --ksm-metric-labels-allow-list \"=namespaces=[k8s-label-1,k8s-label-n,...],pods=[app],...)\" and --ksm-metric-annotations-allow-list \"namespaces=[kubernetes.io/team,...],pods=[kubernetes.io/team],...\"")
-            if previous != ord("]"):
-                labelValueMap[name].append(ksmparam[firstWordPos:i])
-            firstWordPos = i + 1
-    for label in labelValueMap:
-        if (bool(re.match(r'^[a-zA-Z_][A-Za-z0-9_]+$', label))) is False:
-            raise InvalidArgumentValueError("Please format --metric properly. For eg. : --ksm-metric-labels-allow-list \"=namespaces=[k8s-label-1,k8s-label-n,...],pods=[app],...)\" and --ksm-metric-annotations-allow-list \"namespaces=[kubernetes.io/team,...],pods=[kubernetes.io/team],...\"")
+    if not _re_ksm_metric_groups.fullmatch(ksmparam):
+        raise InvalidArgumentValueError(_ksm_metric_format_error)
 
 
 def validate_ksm_labels(namespace):
-    if namespace.ksm_metric_labels_allow_list is None:
+    allow_list = namespace.ksm_metric_labels_allow_list
+    if not allow_list:
         return
-    validate_ksm_parameter(namespace.ksm_metric_labels_allow_list)
+    validate_ksm_parameter(allow_list)
 
 
 def validate_ksm_annotations(namespace):
-    if namespace.ksm_metric_annotations_allow_list is None:
+    allow_list = namespace.ksm_metric_annotations_allow_list
+    if not allow_list:
         return
-    validate_ksm_parameter(namespace.ksm_metric_annotations_allow_list)
+    validate_ksm_parameter(allow_list)
@@ -4,9 +4,11 @@
 # --------------------------------------------------------------------------------------------
 import unittest
 from types import SimpleNamespace
+from unittest.mock import patch
 
+import azure.cli.core.keys as keys
 from azure.cli.core.util import CLIError
-from azure.cli.core.azclierror import InvalidArgumentValueError
+from azure.cli.core.azclierror import ArgumentUsageError, InvalidArgumentValueError
 import azext_aks_preview._validators as validators
 from azext_aks_preview._consts import ADDONS
 
@@ -117,7 +119,7 @@ class EnableCustomCATrustNamespace:
 
 class TestMaxSurge(unittest.TestCase):
     def test_valid_cases(self):
-        valid = ["5", "33%", "1", "100%"]
+        valid = ["5", "33%", "1", "100%", "-0", "-0%"]
         for v in valid:
             validators.validate_max_surge(MaxSurgeNamespace(v))
 
@@ -131,6 +133,12 @@ class TestMaxSurge(unittest.TestCase):
             validators.validate_max_surge(MaxSurgeNamespace("-3"))
         self.assertTrue('positive' in str(cm.exception), msg=str(cm.exception))
 
+    def test_throws_on_signed_or_padded(self):
+        for v in ["+5", "+5%", " 5", "5 ", "1_0"]:
+            with self.assertRaises(CLIError) as cm:
+                validators.validate_max_surge(MaxSurgeNamespace(v))
+            self.assertTrue('int or percentage' in str(cm.exception), msg=str(cm.exception))
+
 
 class TestSpotMaxPrice(unittest.TestCase):
     def test_valid_cases(self):
@@ -310,6 +318,13 @@ class TestValidateKubernetesVersion(unittest.TestCase):
 
         validators.validate_k8s_version(namespace)
 
+    def test_valid_prefixed_kubernetes_version(self):
+        kubernetes_version = "v1.11.8"
+        namespace = Namespace(kubernetes_version=kubernetes_version)
+
+        validators.validate_k8s_version(namespace)
+        self.assertEqual(namespace.kubernetes_version, "1.11.8")
+
     def test_valid_empty_kubernetes_version(self):
         kubernetes_version = ""
         namespace = Namespace(kubernetes_version=kubernetes_version)
@@ -335,6 +350,14 @@ class TestValidateKubernetesVersion(unittest.TestCase):
             validators.validate_k8s_version(namespace)
         self.assertEqual(str(cm.exception), err)
 
+        kubernetes_version = "v"
+
+        namespace = Namespace(kubernetes_version=kubernetes_version)
+
+        with self.assertRaises(CLIError) as cm:
+            validators.validate_k8s_version(namespace)
+        self.assertEqual(str(cm.exception), err)
+
 class HostGroupIDNamespace:
 
     def __init__(self, host_group_id):
@@ -498,5 +521,129 @@ class TestValidateNodepoolName(unittest.TestCase):
         )
 
 
+class TestValidateLinuxHostName(unittest.TestCase):
+    def test_valid_linux_host_name(self):
+        namespace = SimpleNamespace(name="my-cluster.contoso")
+        validators.validate_linux_host_name(namespace)
+
+    def test_invalid_linux_host_name_too_long(self):
+        namespace = SimpleNamespace(name="a" * 40 + "." + "b" * 40)
+        with self.assertRaises(CLIError):
+            validators.validate_linux_host_name(namespace)
+
+    def test_invalid_linux_host_name_character(self):
+        namespace = SimpleNamespace(name="my_cluster")
+        with self.assertRaises(CLIError):
+            validators.validate_linux_host_name(namespace)
+
+
+class TestValidateAzureMonitorAndGrafanaResourceId(unittest.TestCase):
+    def test_valid_azure_monitor_workspace_resource_id(self):
+        namespace = SimpleNamespace(
+            azure_monitor_workspace_resource_id="/subscriptions/sub/resourceGroups/rg/providers/Microsoft.Monitor/accounts/amw/"
+        )
+        validators.validate_azuremonitorworkspaceresourceid(namespace)
+
+    def test_invalid_azure_monitor_workspace_resource_id(self):
+        for resource_id in [
+            "/subscriptions/sub/resourceGroups/rg/providers/Microsoft.Monitor/accounts",
+            "/subscriptions/sub/resourceGroups/rg/providers/Microsoft.Dashboard/grafana/graf",
+            "/subscriptions//resourceGroups/rg/providers/Microsoft.Monitor/accounts/amw",
+        ]:
+            namespace = SimpleNamespace(azure_monitor_workspace_resource_id=resource_id)
+            with self.assertRaises(ArgumentUsageError):
+                validators.validate_azuremonitorworkspaceresourceid(namespace)
+
+    def test_valid_grafana_resource_id(self):
+        namespace = SimpleNamespace(
+            grafana_resource_id="subscriptions/sub/resourceGroups/rg/providers/Microsoft.Dashboard/grafana/graf"
+        )
+        validators.validate_grafanaresourceid(namespace)
+
+    def test_invalid_grafana_resource_id(self):
+        namespace = SimpleNamespace(
+            grafana_resource_id="/subscriptions/sub/resourceGroups/rg/providers/Microsoft.Monitor/accounts/amw"
+        )
+        with self.assertRaises(ArgumentUsageError):
+            validators.validate_grafanaresourceid(namespace)
+
+
+class TestValidateTaints(unittest.TestCase):
+    def test_valid_taints(self):
+        namespace = SimpleNamespace(node_taints="key1=value1:NoSchedule,example.com/key2=value2:NoExecute,")
+        validators.validate_taints(namespace)
+
+    def test_invalid_taints(self):
+        for node_taints in ["key1=value1", "key1:NoSchedule", "key1=value1:NoReschedule", "-key1=value1:NoSchedule"]:
+            namespace = SimpleNamespace(node_taints=node_taints)
+            with self.assertRaises(CLIError) as cm:
+                validators.validate_taints(namespace)
+            self.assertEqual(str(cm.exception), "Invalid node taint: %s" % node_taints)
+
+
+class TestValidateKsmParameter(unittest.TestCase):
+    def test_valid_ksm_parameter(self):
+        validators.validate_ksm_parameter("")
+        validators.validate_ksm_parameter("pods=[]")
+        validators.validate_ksm_parameter("namespaces=[k8s-label-1,k8s-label-n],pods=[app]")
+        validators.validate_ksm_parameter("namespaces=[kubernetes.io/team],pods=[kubernetes.io/team,app]")
+
+    def test_invalid_ksm_parameter(self):
+        for ksmparam in [
+            "pods",
+            "pods=app",
+            "pods=[app",
+            "pods=[app],",
+            "pods=[app,]",
+            "pods=[app,,web]",
+            "pods=[app]web",
+            "pods=[app],,namespaces=[team]",
+            "pods=[app],namespaces",
+            "=pods=[app]",
+            "web,pods=[app]",
+            "pods=[app=web]",
+            "1pods=[app]",
+        ]:
+            with self.assertRaises(InvalidArgumentValueError):
+                validators.validate_ksm_parameter(ksmparam)
+
+
+class TestValidateSshKey(unittest.TestCase):
+    valid_key = (
+        "ssh-rsa AAAAB3NzaC1yc2EAAAADAQABAAABAQC1evQgTAgGx0bHhchZnC1dPGDHgMdSJ590oD7ZTy/1tiDgD+Zqhe"
+        "ND1OW3/p54FpBlIAb/KuejEZ4dE9YLkMQtOHduf9+iTVXUscuH0sjf9r9xBPEQ2XLW24byIg1iRQE7dzzafEY2beXJ"
+        "TqxUBemwz6J2SdFfDK6e34VA8623i/3Zl0NYGf0GqhzIjA3hIcVsSU4gku0TZTEKBYTAdz4h95Nl8/0v+u6bGDO05W"
+        "jzSgpoNwx14mRKM7ixsgje/a4tfoS2k8pbtsRFN0LQcpo7LIKSpSLKXQ1keFPt0cLAZmNXk7e/q5wRHXJlgPA38Sj0"
+        "zDzKv+lF9yBLScnvDb6n"
+    )
+
+    def test_valid_inline_key_skips_file_lookup(self):
+        namespace = SimpleNamespace(no_ssh_key=False, ssh_key_value=self.valid_key, generate_ssh_keys=False)
+        with patch("os.path.exists") as mock_exists:
+            validators.validate_ssh_key(namespace)
+        mock_exists.assert_not_called()
+        self.assertEqual(namespace.ssh_key_value, self.valid_key)
+
+    def test_invalid_inline_value_checks_file_then_fails(self):
+        namespace = SimpleNamespace(no_ssh_key=False, ssh_key_value="ssh-notakey", generate_ssh_keys=False)
+        with patch("os.path.exists", return_value=False) as mock_exists, patch(
+            "azure.cli.core.keys.is_valid_ssh_rsa_public_key", wraps=keys.is_valid_ssh_rsa_public_key
+        ) as mock_is_valid:
+            with self.assertRaises(CLIError):
+                validators.validate_ssh_key(namespace)
+        mock_exists.assert_called_once_with("ssh-notakey")
+        mock_is_valid.assert_called_once_with("ssh-notakey")
+
+    def test_invalid_inline_value_generates_keys(self):
+        namespace = SimpleNamespace(no_ssh_key=False, ssh_key_value="ssh-notakey", generate_ssh_keys=True)
+        with patch("os.path.exists", return_value=False) as mock_exists, patch(
+            "azure.cli.core.keys.generate_ssh_keys", return_value="generated-key"
+        ) as mock_generate:
+            validators.validate_ssh_key(namespace)
+        mock_exists.assert_called_once_with("ssh-notakey")
+        mock_generate.assert_called_once_with("ssh-notakey.private", "ssh-notakey")
+        self.assertEqual(namespace.ssh_key_value, "generated-key")
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -5,6 +5,7 @@
 # pylint: disable=line-too-long, too-many-statements
 
 from argcomplete.completers import FilesCompleter
+from knack.arguments import CLIArgumentType
 
 from azext_cosmosdb_preview._validators import (
     validate_gossip_certificates,
@@ -64,26 +65,58 @@ MONGO_USER_DEFINITION_EXAMPLE = """--body "{
 }"
 """
 
+MONGO_ROLE_DEFINITION_BODY_HELP = "Role Definition body with Id (Optional for create), Type (Default is CustomRole), DatabaseName, Privileges, Roles.  You can enter it as a string or as a file, e.g., --body @mongo-role_definition-body-file.json or " + MONGO_ROLE_DEFINITION_EXAMPLE
+MONGO_USER_DEFINITION_BODY_HELP = "User Definition body with Id (Optional for create), UserName, Password, DatabaseName, CustomData, Mechanisms, Roles.  You can enter it as a string or as a file, e.g., --body @mongo-user_definition-body-file.json or " + MONGO_USER_DEFINITION_EXAMPLE
+
+account_name_type = CLIArgumentType(options_list=('--account-name', '-a'), help="Cosmosdb account name.")
+required_account_name_type = CLIArgumentType(overrides=account_name_type, id_part=None, required=True, help='Name of the CosmosDB database account')
+database_name_type = CLIArgumentType(options_list=('--database-name', '-d'), help='Database name.')
+job_name_type = CLIArgumentType(options_list=('--job-name', '-n'), help='Name of the Data Transfer Job. A random job name will be generated if not passed.')
+cluster_name_type = CLIArgumentType(options_list=('--cluster-name', '-c'), help="Cluster Name", required=True)
+three_state_flag_type = get_three_state_flag()
+location_type = CLIArgumentType(options_list=('--location', '-l'), help="Location", required=True)
+instance_id_type = CLIArgumentType(options_list=('--instance-id', '-i'), help="InstanceId of the Account", required=True)
+start_time_type = CLIArgumentType(options_list=('--start-time', '-s'), required=False)
+end_time_type = CLIArgumentType(options_list=('--end-time', '-e'), required=False)
+required_name_type = CLIArgumentType(options_list=('--name', '-n'), required=True)
+database_rid_type = CLIArgumentType(options_list=('--database-rid', '-d'), help="Rid of the database", required=True)
+restore_location_type = CLIArgumentType(options_list=('--restore-location', '-r'), help="The region of the restore.", required=True)
+restore_timestamp_in_utc_type = CLIArgumentType(options_list=('--restore-timestamp', '-t'), help="The timestamp of the restore", required=True)
+physical_partition_ids_type = CLIArgumentType(options_list=('--physical-partition-ids', '-p'), nargs='+', action=CreatePhysicalPartitionIdListAction, required=False, help='space separated list of physical partition ids')
+target_partition_info_type = CLIArgumentType(nargs='+', action=CreateTargetPhysicalPartitionThroughputInfoAction, required=False)
+source_partition_info_type = CLIArgumentType(nargs='+', action=CreateSourcePhysicalPartitionThroughputInfoAction, required=False, help="space separated source physical partition ids eg: 1 2")
+restore_timestamp_type = CLIArgumentType(options_list=('--restore-timestamp', '-t'), action=UtcDatetimeAction, required=True)
+
+cassandra_cluster_write_scopes = (
+    'managed-cassandra cluster create',
+    'managed-cassandra cluster update')
+cassandra_cluster_scopes = cassandra_cluster_write_scopes + (
+    'managed-cassandra cluster show',
+    'managed-cassandra cluster delete',
+    'managed-cassandra cluster backup list',
+    'managed-cassandra cluster backup show')
+cassandra_datacenter_write_scopes = (
+    'managed-cassandra datacenter create',
+    'managed-cassandra datacenter update')
+cassandra_datacenter_scopes = cassandra_datacenter_write_scopes + (
+    'managed-cassandra datacenter show',
+    'managed-cassandra datacenter delete')
+account_write_scopes = ('cosmosdb create', 'cosmosdb update')
+dts_job_scopes = (
+    'cosmosdb dts show',
+    'cosmosdb dts pause',
+    'cosmosdb dts resume',
+    'cosmosdb dts cancel')
 
-def load_arguments(self, _):
-    from knack.arguments import CLIArgumentType
-    account_name_type = CLIArgumentType(options_list=['--account-name', '-a'], help="Cosmosdb account name.")
 
+def load_arguments(self, _):
     # Managed Cassandra Cluster
-    for scope in [
-            'managed-cassandra cluster create',
-            'managed-cassandra cluster update',
-            'managed-cassandra cluster show',
-            'managed-cassandra cluster delete',
-            'managed-cassandra cluster backup list',
-            'managed-cassandra cluster backup show']:
+    for scope in cassandra_cluster_scopes:
         with self.argument_context(scope) as c:
-            c.argument('cluster_name', options_list=['--cluster-name', '-c'], help="Cluster Name", required=True)
+            c.argument('cluster_name', arg_type=cluster_name_type)
 
     # Managed Cassandra Cluster
-    for scope in [
-            'managed-cassandra cluster create',
-            'managed-cassandra cluster update']:
+    for scope in cassandra_cluster_write_scopes:
         with self.argument_context(scope) as c:
             c.argument('tags', arg_type=tags_type)
             c.argument('external_gossip_certificates', nargs='+', validator=validate_gossip_certificates, options_list=['--external-gossip-certificates', '-e'], help="A list of certificates that the managed cassandra data center's should accept.")
@@ -105,24 +138,17 @@ def load_arguments(self, _):
         c.argument('cluster_name_override', help="If a cluster must have a name that is not a valid azure resource name, this field can be specified to choose the Cassandra cluster name. Otherwise, the resource name will be used as the cluster name.")
 
     # Managed Cassandra Cluster
-    for scope in ['managed-cassandra cluster backup show']:
-        with self.argument_context(scope) as c:
-            c.argument('backup_id', options_list=['--backup-id'], help="The resource id of the backup", required=True)
+    with self.argument_context('managed-cassandra cluster backup show') as c:
+        c.argument('backup_id', options_list=['--backup-id'], help="The resource id of the backup", required=True)
 
     # Managed Cassandra Datacenter
-    for scope in [
-            'managed-cassandra datacenter create',
-            'managed-cassandra datacenter update',
-            'managed-cassandra datacenter show',
-            'managed-cassandra datacenter delete']:
+    for scope in cassandra_datacenter_scopes:
         with self.argument_context(scope) as c:
-            c.argument('cluster_name', options_list=['--cluster-name', '-c'], help="Cluster Name", required=True)
+            c.argument('cluster_name', arg_type=cluster_name_type)
             c.argument('data_center_name', options_list=['--data-center-name', '-d'], help="Datacenter Name", required=True)
 
     # Managed Cassandra Datacenter
-    for scope in [
-            'managed-cassandra datacenter create',
-            'managed-cassandra datacenter update']:
+    for scope in cassandra_datacenter_write_scopes:
         with self.argument_context(scope) as c:
             c.argument('node_count', options_list=['--node-count', '-n'], validator=validate_node_count, help="The number of Cassandra virtual machines in this data center. The minimum value is 3.")
             c.argument('base64_encoded_cassandra_yaml_fragment', options_list=['--base64-encoded-cassandra-yaml-fragment', '-b'], help="This is a Base64 encoded yaml file that is a subset of cassandra.yaml.  Supported fields will be honored and others will be ignored.")
@@ -146,11 +172,11 @@ def load_arguments(self, _):
         c.argument('sku', options_list=['--sku'], help="Virtual Machine SKU used for data centers. Default value is Standard_DS14_v2")
         c.argument('disk_sku', options_list=['--disk-sku'], help="Disk SKU used for data centers. Default value is P30.")
         c.argument('disk_capacity', options_list=['--disk-capacity'], help="Number of disk used for data centers. Default value is 4.")
-        c.argument('availability_zone', options_list=['--availability-zone', '-z'], arg_type=get_three_state_flag(), help="If the data center haves Availability Zone feature, apply it to the Virtual Machine ScaleSet that host the data center virtual machines.")
+        c.argument('availability_zone', options_list=['--availability-zone', '-z'], arg_type=three_state_flag_type, help="If the data center haves Availability Zone feature, apply it to the Virtual Machine ScaleSet that host the data center virtual machines.")
 
     # Managed Cassandra Datacenter
     with self.argument_context('managed-cassandra datacenter list') as c:
-        c.argument('cluster_name', options_list=['--cluster-name', '-c'], help="Cluster Name", required=True)
+        c.argument('cluster_name', arg_type=cluster_name_type)
 
     # Services
     with self.argument_context('cosmosdb service') as c:
@@ -168,13 +194,13 @@ def load_arguments(self, _):
     with self.argument_context('cosmosdb mongodb role definition') as c:
         c.argument('account_name', account_name_type, id_part=None)
         c.argument('mongo_role_definition_id', options_list=['--id', '-i'], validator=validate_mongo_role_definition_id, help="Unique ID for the Mongo Role Definition.")
-        c.argument('mongo_role_definition_body', options_list=['--body', '-b'], validator=validate_mongo_role_definition_body, completer=FilesCompleter(), help="Role Definition body with Id (Optional for create), Type (Default is CustomRole), DatabaseName, Privileges, Roles.  You can enter it as a string or as a file, e.g., --body @mongo-role_definition-body-file.json or " + MONGO_ROLE_DEFINITION_EXAMPLE)
+        c.argument('mongo_role_definition_body', options_list=['--body', '-b'], validator=validate_mongo_role_definition_body, completer=FilesCompleter(), help=MONGO_ROLE_DEFINITION_BODY_HELP)
 
     # Mongo user definition
     with self.argument_context('cosmosdb mongodb user definition') as c:
         c.argument('account_name', account_name_type, id_part=None)
         c.argument('mongo_user_definition_id', options_list=['--id', '-i'], validator=validate_mongo_user_definition_id, help="Unique ID for the Mongo User Definition.")
-        c.argument('mongo_user_definition_body', options_list=['--body', '-b'], validator=validate_mongo_user_definition_body, completer=FilesCompleter(), help="User Definition body with Id (Optional for create), UserName, Password, DatabaseName, CustomData, Mechanisms, Roles.  You can enter it as a string or as a file, e.g., --body @mongo-user_definition-body-file.json or " + MONGO_USER_DEFINITION_EXAMPLE)
+        c.argument('mongo_user_definition_body', options_list=['--body', '-b'], validator=validate_mongo_user_definition_body, completer=FilesCompleter(), help=MONGO_USER_DEFINITION_BODY_HELP)
 
     with self.argument_context('cosmosdb') as c:
         c.argument('account_name', arg_type=name_type, help='Name of the Cosmos DB database account', completer=get_resource_name_completion_list('Microsoft.DocumentDb/databaseAccounts'), id_part='name')
@@ -184,16 +210,16 @@ def load_arguments(self, _):
     with self.argument_context('cosmosdb create') as c:
         c.argument('account_name', completer=None)
         c.argument('key_uri', help="The URI of the key vault", is_preview=True)
-        c.argument('enable_free_tier', arg_type=get_three_state_flag(), help="If enabled the account is free-tier.", is_preview=True)
+        c.argument('enable_free_tier', arg_type=three_state_flag_type, help="If enabled the account is free-tier.", is_preview=True)
         c.argument('assign_identity', nargs='*', help="Assign system or user assigned identities separated by spaces. Use '[system]' to refer system assigned identity.", is_preview=True)
-        c.argument('is_restore_request', options_list=['--is-restore-request', '-r'], arg_type=get_three_state_flag(), help="Restore from an existing/deleted account.", is_preview=True, arg_group='Restore')
+        c.argument('is_restore_request', options_list=['--is-restore-request', '-r'], arg_type=three_state_flag_type, help="Restore from an existing/deleted account.", is_preview=True, arg_group='Restore')
         c.argument('restore_source', help="The restorable-database-account Id of the source account from which the account has to be restored. Required if --is-restore-request is set to true.", is_preview=True, arg_group='Restore')
         c.argument('restore_timestamp', action=UtcDatetimeAction, help="The timestamp to which the account has to be restored to. Required if --is-restore-request is set to true.", is_preview=True, arg_group='Restore')
         c.argument('databases_to_restore', nargs='+', action=CreateDatabaseRestoreResource, is_preview=True, arg_group='Restore')
         c.argument('gremlin_databases_to_restore', nargs='+', action=CreateGremlinDatabaseRestoreResource, is_preview=True, arg_group='Restore')
         c.argument('tables_to_restore', nargs='+', action=CreateTableRestoreResource, is_preview=True, arg_group='Restore')
 
-    for scope in ['cosmosdb create', 'cosmosdb update']:
+    for scope in account_write_scopes:
         with self.argument_context(scope) as c:
             c.ignore('resource_group_location')
             c.argument('locations', nargs='+', action=CreateLocation)
@@ -203,14 +229,14 @@ def load_arguments(self, _):
             c.argument('max_interval', type=int, help="when used with Bounded Staleness consistency, this value represents the time amount of staleness (in seconds) tolerated. Accepted range for this value is 1 - 100")
             c.argument('ip_range_filter', nargs='+', options_list=['--ip-range-filter'], validator=validate_ip_range_filter, help="firewall support. Specifies the set of IP addresses or IP address ranges in CIDR form to be included as the allowed list of client IPs for a given database account. IP addresses/ranges must be comma-separated and must not contain any spaces")
             c.argument('kind', arg_type=get_enum_type(DatabaseAccountKind), help='The type of Cosmos DB database account to create')
-            c.argument('enable_automatic_failover', arg_type=get_three_state_flag(), help='Enables automatic failover of the write region in the rare event that the region is unavailable due to an outage. Automatic failover will result in a new write region for the account and is chosen based on the failover priorities configured for the account.')
+            c.argument('enable_automatic_failover', arg_type=three_state_flag_type, help='Enables automatic failover of the write region in the rare event that the region is unavailable due to an outage. Automatic failover will result in a new write region for the account and is chosen based on the failover priorities configured for the account.')
             c.argument('capabilities', nargs='+', validator=validate_capabilities, help='set custom capabilities on the Cosmos DB database account.')
-            c.argument('enable_virtual_network', arg_type=get_three_state_flag(), help='Enables virtual network on the Cosmos DB database account')
+            c.argument('enable_virtual_network', arg_type=three_state_flag_type, help='Enables virtual network on the Cosmos DB database account')
             c.argument('virtual_network_rules', nargs='+', validator=validate_virtual_network_rules, help='ACL\'s for virtual network')
-            c.argument('enable_multiple_write_locations', arg_type=get_three_state_flag(), help="Enable Multiple Write Locations")
-            c.argument('disable_key_based_metadata_write_access', arg_type=get_three_state_flag(), help="Disable write operations on metadata resources (databases, containers, throughput) via account keys")
-            c.argument('enable_public_network', options_list=['--enable-public-network', '-e'], arg_type=get_three_state_flag(), help="Enable or disable public network access to server.")
-            c.argument('enable_analytical_storage', arg_type=get_three_state_flag(), help="Flag to enable log storage on the account.")
+            c.argument('enable_multiple_write_locations', arg_type=three_state_flag_type, help="Enable Multiple Write Locations")
+            c.argument('disable_key_based_metadata_write_access', arg_type=three_state_flag_type, help="Disable write operations on metadata resources (databases, containers, throughput) via account keys")
+            c.argument('enable_public_network', options_list=['--enable-public-network', '-e'], arg_type=three_state_flag_type, help="Enable or disable public network access to server.")
+            c.argument('enable_analytical_storage', arg_type=three_state_flag_type, help="Flag to enable log storage on the account.")
             c.argument('network_acl_bypass', arg_type=get_enum_type(NetworkAclBypass), options_list=['--network-acl-bypass'], help="Flag to enable or disable Network Acl Bypass.")
             c.argument('network_acl_bypass_resource_ids', nargs='+', options_list=['--network-acl-bypass-resource-ids', '-i'], help="List of Resource Ids to allow Network Acl Bypass.")
             c.argument('backup_interval', type=int, help="the frequency(in minutes) with which backups are taken (only for accounts with periodic mode backups)", arg_group='Backup Policy')
@@ -221,7 +247,7 @@ def load_arguments(self, _):
             c.argument('analytical_storage_schema_type', options_list=['--analytical-storage-schema-type', '--as-schema'], arg_type=get_enum_type(AnalyticalStorageSchemaType), help="Schema type for analytical storage.", arg_group='Analytical Storage Configuration')
             c.argument('backup_policy_type', arg_type=get_enum_type(BackupPolicyType), help="The type of backup policy of the account to create", arg_group='Backup Policy')
             c.argument('continuous_tier', arg_type=get_enum_type(ContinuousTier), help="The tier of Continuous backup", arg_group='Backup Policy')
-            c.argument('enable_materialized_views', options_list=['--enable-materialized-views', '--enable-mv'], arg_type=get_three_state_flag(), help="Flag to enable MaterializedViews on the account.", is_preview=True)
+            c.argument('enable_materialized_views', options_list=['--enable-materialized-views', '--enable-mv'], arg_type=three_state_flag_type, help="Flag to enable MaterializedViews on the account.", is_preview=True)
 
     with self.argument_context('cosmosdb restore') as c:
         c.argument('target_database_account_name', options_list=['--target-database-account-name', '-n'], help='Name of the new target Cosmos DB database account after the restore')
@@ -236,81 +262,79 @@ def load_arguments(self, _):
 
     # Restorable Database Accounts
     with self.argument_context('cosmosdb restorable-database-account show') as c:
-        c.argument('location', options_list=['--location', '-l'], help="Location", required=False)
-        c.argument('instance_id', options_list=['--instance-id', '-i'], help="InstanceId of the Account", required=False)
+        c.argument('location', arg_type=location_type, required=False)
+        c.argument('instance_id', arg_type=instance_id_type, required=False)
 
     with self.argument_context('cosmosdb restorable-database-account list') as c:
-        c.argument('location', options_list=['--location', '-l'], help="Location", required=False)
+        c.argument('location', arg_type=location_type, required=False)
         c.argument('account_name', options_list=['--account-name', '-n'], help="Name of the Account", required=False, id_part=None)
 
     # Restorable Sql Containers
     with self.argument_context('cosmosdb sql restorable-container') as c:
-        c.argument('location', options_list=['--location', '-l'], help="Location", required=True)
-        c.argument('instance_id', options_list=['--instance-id', '-i'], help="InstanceId of the Account", required=True)
-        c.argument('restorable_sql_database_rid', options_list=['--database-rid', '-d'], help="Rid of the database", required=True)
-        c.argument('start_time', options_list=['--start-time', '-s'], help="Start time of restorable Sql container event feed", required=False)
-        c.argument('end_time', options_list=['--end-time', '-e'], help="End time of restorable Sql container event feed", required=False)
+        c.argument('location', arg_type=location_type)
+        c.argument('instance_id', arg_type=instance_id_type)
+        c.argument('restorable_sql_database_rid', arg_type=database_rid_type)
+        c.argument('start_time', arg_type=start_time_type, help="Start time of restorable Sql container event feed")
+        c.argument('end_time', arg_type=end_time_type, help="End time of restorable Sql container event feed")
 
     # Restorable Mongodb Collections
     with self.argument_context('cosmosdb mongodb restorable-collection') as c:
-        c.argument('location', options_list=['--location', '-l'], help="Location", required=True)
-        c.argument('instance_id', options_list=['--instance-id', '-i'], help="InstanceId of the Account", required=True)
-        c.argument('restorable_mongodb_database_rid', options_list=['--database-rid', '-d'], help="Rid of the database", required=True)
-        c.argument('start_time', options_list=['--start-time', '-s'], help="Start time of restorable MongoDB collections event feed", required=False)
-        c.argument('end_time', options_list=['--end-time', '-e'], help="End time of restorable MongoDB collections event feed", required=False)
+        c.argument('location', arg_type=location_type)
+        c.argument('instance_id', arg_type=instance_id_type)
+        c.argument('restorable_mongodb_database_rid', arg_type=database_rid_type)
+        c.argument('start_time', arg_type=start_time_type, help="Start time of restorable MongoDB collections event feed")
+        c.argument('end_time', arg_type=end_time_type, help="End time of restorable MongoDB collections event feed")
 
     # Restorable Gremlin Databases
     with self.argument_context('cosmosdb gremlin restorable-database') as c:
-        c.argument('location', options_list=['--location', '-l'], help="Location", required=True)
-        c.argument('instance_id', options_list=['--instance-id', '-i'], help="InstanceId of the Account", required=True)
+        c.argument('location', arg_type=location_type)
+        c.argument('instance_id', arg_type=instance_id_type)
 
     # Restorable Gremlin Graphs
     with self.argument_context('cosmosdb gremlin restorable-graph') as c:
-        c.argument('location', options_list=['--location', '-l'], help="Location", required=True)
-        c.argument('instance_id', options_list=['--instance-id', '-i'], help="InstanceId of the Account", required=True)
-        c.argument('restorable_gremlin_database_rid', options_list=['--database-rid', '-d'], help="Rid of the gremlin database", required=True)
-        c.argument('start_time', options_list=['--start-time', '-s'], help="Start time of restorable Gremlin graph event feed", required=False)
-        c.argument('end_time', options_list=['--end-time', '-e'], help="End time of restorable Gremlin graph event feed", required=False)
+        c.argument('location', arg_type=location_type)
+        c.argument('instance_id', arg_type=instance_id_type)
+        c.argument('restorable_gremlin_database_rid', arg_type=database_rid_type, help="Rid of the gremlin database")
+        c.argument('start_time', arg_type=start_time_type, help="Start time of restorable Gremlin graph event feed")
+        c.argument('end_time', arg_type=end_time_type, help="End time of restorable Gremlin graph event feed")
 
     # Restorable Gremlin Resources
     with self.argument_context('cosmosdb gremlin restorable-resource') as c:
-        c.argument('location', options_list=['--location', '-l'], help="Azure Location of the account", required=True)
-        c.argument('instance_id', options_list=['--instance-id', '-i'], help="InstanceId of the Account", required=True)
-        c.argument('restore_location', options_list=['--restore-location', '-r'], help="The region of the restore.", required=True)
-        c.argument('restore_timestamp_in_utc', options_list=['--restore-timestamp', '-t'], help="The timestamp of the restore", required=True)
+        c.argument('location', arg_type=location_type, help="Azure Location of the account")
+        c.argument('instance_id', arg_type=instance_id_type)
+        c.argument('restore_location', arg_type=restore_location_type)
+        c.argument('restore_timestamp_in_utc', arg_type=restore_timestamp_in_utc_type)
 
     # Restorable Tables
     with self.argument_context('cosmosdb table restorable-table') as c:
-        c.argument('location', options_list=['--location', '-l'], help="Location", required=True)
-        c.argument('instance_id', options_list=['--instance-id', '-i'], help="InstanceId of the Account", required=True)
-        c.argument('start_time', options_list=['--start-time', '-s'], help="Start time of restorable tables event feed", required=False)
-        c.argument('end_time', options_list=['--end-time', '-e'], help="End time of restorable tables event feed", required=False)
+        c.argument('location', arg_type=location_type)
+        c.argument('instance_id', arg_type=instance_id_type)
+        c.argument('start_time', arg_type=start_time_type, help="Start time of restorable tables event feed")
+        c.argument('end_time', arg_type=end_time_type, help="End time of restorable tables event feed")
 
     # Restorable table Resources
     with self.argument_context('cosmosdb table restorable-resource') as c:
-        c.argument('location', options_list=['--location', '-l'], help="Azure Location of the account", required=True)
-        c.argument('instance_id', options_list=['--instance-id', '-i'], help="InstanceId of the Account", required=True)
-        c.argument('restore_location', options_list=['--restore-location', '-r'], help="The region of the restore.", required=True)
-        c.argument('restore_timestamp_in_utc', options_list=['--restore-timestamp', '-t'], help="The timestamp of the restore", required=True)
+        c.argument('location', arg_type=location_type, help="Azure Location of the account")
+        c.argument('instance_id', arg_type=instance_id_type)
+        c.argument('restore_location', arg_type=restore_location_type)
+        c.argument('restore_timestamp_in_utc', arg_type=restore_timestamp_in_utc_type)
 
     # Retrive Gremlin Graph Backup Info
-    database_name_type = CLIArgumentType(options_list=['--database-name', '-d'], help='Database name.')
     with self.argument_context('cosmosdb gremlin retrieve-latest-backup-time') as c:
-        c.argument('account_name', account_name_type, id_part=None, required=True, help='Name of the CosmosDB database account')
+        c.argument('account_name', required_account_name_type)
         c.argument('database_name', database_name_type, required=True, help='Name of the CosmosDB Gremlin database name')
         c.argument('graph_name', options_list=['--graph-name', '-n'], required=True, help='Name of the CosmosDB Gremlin graph name')
-        c.argument('location', options_list=['--location', '-l'], help="Location of the account", required=True)
+        c.argument('location', arg_type=location_type, help="Location of the account")
 
     # Retrive Table Backup Info
     with self.argument_context('cosmosdb table retrieve-latest-backup-time') as c:
-        c.argument('account_name', account_name_type, id_part=None, required=True, help='Name of the CosmosDB database account')
+        c.argument('account_name', required_account_name_type)
         c.argument('table_name', options_list=['--table-name', '-n'], required=True, help='Name of the CosmosDB Table name')
-        c.argument('location', options_list=['--location', '-l'], help="Location of the account", required=True)
+        c.argument('location', arg_type=location_type, help="Location of the account")
 
     with self.argument_context('cosmosdb dts') as c:
         c.argument('account_name', account_name_type, id_part=None, help='Name of the CosmosDB database account.')
 
-    job_name_type = CLIArgumentType(options_list=['--job-name', '-n'], help='Name of the Data Transfer Job. A random job name will be generated if not passed.')
     with self.argument_context('cosmosdb dts copy') as c:
         c.argument('job_name', job_name_type)
         c.argument('source_cassandra_table', nargs='+', action=AddCassandraTableAction, help='Source cassandra table')
@@ -319,83 +343,78 @@ def load_arguments(self, _):
         c.argument('dest_sql_container', nargs='+', action=AddSqlContainerAction, help='Destination sql container')
         c.argument('worker_count', type=int, help='Worker count')
 
-    for scope in [
-            'cosmosdb dts show',
-            'cosmosdb dts pause',
-            'cosmosdb dts resume',
-            'cosmosdb dts cancel']:
+    for scope in dts_job_scopes:
         with self.argument_context(scope) as c:
-            c.argument('job_name', options_list=['--job-name', '-n'], help='Name of the Data Transfer Job.')
+            c.argument('job_name', job_name_type, help='Name of the Data Transfer Job.')
 
     # Sql container partition merge
-    database_name_type = CLIArgumentType(options_list=['--database-name', '-d'], help='Database name.')
     with self.argument_context('cosmosdb sql container merge') as c:
-        c.argument('account_name', account_name_type, id_part=None, required=True, help='Name of the CosmosDB database account')
+        c.argument('account_name', required_account_name_type)
         c.argument('database_name', database_name_type, required=True, help='Name of the CosmosDB database name')
-        c.argument('container_name', options_list=['--name', '-n'], required=True, help='Name of the CosmosDB collection')
+        c.argument('container_name', arg_type=required_name_type, help='Name of the CosmosDB collection')
 
     # mongodb collection partition merge
     with self.argument_context('cosmosdb mongodb collection merge') as c:
-        c.argument('account_name', account_name_type, id_part=None, required=True, help='Name of the CosmosDB database account')
+        c.argument('account_name', required_account_name_type)
         c.argument('database_name', database_name_type, required=True, help='Name of the mongoDB database')
-        c.argument('container_name', options_list=['--name', '-n'], required=True, help='Name of the mongoDB collection')
+        c.argument('container_name', arg_type=required_name_type, help='Name of the mongoDB collection')
 
     # Sql container partition retrieve throughput
     with self.argument_context('cosmosdb sql container retrieve-partition-throughput') as c:
-        c.argument('account_name', account_name_type, id_part=None, required=True, help='Name of the CosmosDB database account')
+        c.argument('account_name', required_account_name_type)
         c.argument('database_name', database_name_type, required=True, help='Name of the CosmosDB database name')
-        c.argument('container_name', options_list=['--name', '-n'], required=True, help='Name of the CosmosDB container')
-        c.argument('physical_partition_ids', options_list=['--physical-partition-ids', '-p'], nargs='+', action=CreatePhysicalPartitionIdListAction, required=False, help='space separated list of physical partition ids')
-        c.argument('all_partitions', arg_type=get_three_state_flag(), help="switch to retrieve throughput for all physical partitions")
+        c.argument('container_name', arg_type=required_name_type, help='Name of the CosmosDB container')
+        c.argument('physical_partition_ids', arg_type=physical_partition_ids_type)
+        c.argument('all_partitions', arg_type=three_state_flag_type, help="switch to retrieve throughput for all physical partitions")
 
     # Sql container partition redistribute throughput
     with self.argument_context('cosmosdb sql container redistribute-partition-throughput') as c:
-        c.argument('account_name', account_name_type, id_part=None, required=True, help='Name of the CosmosDB database account')
+        c.argument('account_name', required_account_name_type)
         c.argument('database_name', database_name_type, required=True, help='Name of the CosmosDB database name')
-        c.argument('container_name', options_list=['--name', '-n'], required=True, help='Name of the CosmosDB collection')
-        c.argument('evenly_distribute', arg_type=get_three_state_flag(), help="switch to distribute throughput equally among all physical partitions")
-        c.argument('target_partition_info', nargs='+', action=CreateTargetPhysicalPartitionThroughputInfoAction, required=False, help="information about desired target physical partition throughput eg: 0=1200 1=1200")
-        c.argument('source_partition_info', nargs='+', action=CreateSourcePhysicalPartitionThroughputInfoAction, required=False, help="space separated source physical partition ids eg: 1 2")
+        c.argument('container_name', arg_type=required_name_type, help='Name of the CosmosDB collection')
+        c.argument('evenly_distribute', arg_type=three_state_flag_type, help="switch to distribute throughput equally among all physical partitions")
+        c.argument('target_partition_info', arg_type=target_partition_info_type, help="information about desired target physical partition throughput eg: 0=1200 1=1200")
+        c.argument('source_partition_info', arg_type=source_partition_info_type)
 
     # Mongodb collection partition retrieve throughput
     with self.argument_context('cosmosdb mongodb collection retrieve-partition-throughput') as c:
-        c.argument('account_name', account_name_type, id_part=None, required=True, help='Name of the CosmosDB database account')
+        c.argument('account_name', required_account_name_type)
         c.argument('database_name', database_name_type, required=True, help='Name of the CosmosDB database name')
-        c.argument('collection_name', options_list=['--name', '-n'], required=True, help='Name of the CosmosDB container')
-        c.argument('physical_partition_ids', options_list=['--physical-partition-ids', '-p'], nargs='+', action=CreatePhysicalPartitionIdListAction, required=False, help='space separated list of physical partition ids')
-        c.argument('all_partitions', arg_type=get_three_state_flag(), help="switch to retrieve throughput for all physical partitions")
+        c.argument('collection_name', arg_type=required_name_type, help='Name of the CosmosDB container')
+        c.argument('physical_partition_ids', arg_type=physical_partition_ids_type)
+        c.argument('all_partitions', arg_type=three_state_flag_type, help="switch to retrieve throughput for all physical partitions")
 
     # Mongodb collection partition redistribute throughput
     with self.argument_context('cosmosdb mongodb collection redistribute-partition-throughput') as c:
-        c.argument('account_name', account_name_type, id_part=None, required=True, help='Name of the CosmosDB database account')
+        c.argument('account_name', required_account_name_type)
         c.argument('database_name', database_name_type, required=True, help='Name of the CosmosDB database name')
-        c.argument('collection_name', options_list=['--name', '-n'], required=True, help='Name of the CosmosDB collection')
-        c.argument('evenly_distribute', arg_type=get_three_state_flag(), help="switch to distribute throughput equally among all physical partitions")
-        c.argument('target_partition_info', nargs='+', action=CreateTargetPhysicalPartitionThroughputInfoAction, required=False, help="information about desired target physical partition throughput eg: '0=1200 1=1200'")
-        c.argument('source_partition_info', nargs='+', action=CreateSourcePhysicalPartitionThroughputInfoAction, required=False, help="space separated source physical partition ids eg: 1 2")
+        c.argument('collection_name', arg_type=required_name_type, help='Name of the CosmosDB collection')
+        c.argument('evenly_distribute', arg_type=three_state_flag_type, help="switch to distribute throughput equally among all physical partitions")
+        c.argument('target_partition_info', arg_type=target_partition_info_type, help="information about desired target physical partition throughput eg: '0=1200 1=1200'")
+        c.argument('source_partition_info', arg_type=source_partition_info_type)
 
     # SQL database restore
     with self.argument_context('cosmosdb sql database restore') as c:
         c.argument('account_name', account_name_type, id_part=None, required=True)
-        c.argument('database_name', options_list=['--name', '-n'], help="Database name", required=True)
-        c.argument('restore_timestamp', options_list=['--restore-timestamp', '-t'], action=UtcDatetimeAction, help="The timestamp to which the database needs to be restored to.", required=True)
+        c.argument('database_name', arg_type=required_name_type, help="Database name")
+        c.argument('restore_timestamp', arg_type=restore_timestamp_type, help="The timestamp to which the database needs to be restored to.")
 
     # SQL collection restore
     with self.argument_context('cosmosdb sql container restore') as c:
         c.argument('account_name', account_name_type, id_part=None, required=True)
         c.argument('database_name', database_name_type, required=True)
-        c.argument('container_name', options_list=['--name', '-n'], help="Container name", required=True)
-        c.argument('restore_timestamp', options_list=['--restore-timestamp', '-t'], action=UtcDatetimeAction, help="The timestamp to which the container needs to be restored to.", required=True)
+        c.argument('container_name', arg_type=required_name_type, help="Container name")
+        c.argument('restore_timestamp', arg_type=restore_timestamp_type, help="The timestamp to which the container needs to be restored to.")
 
     # MongoDB database restore
     with self.argument_context('cosmosdb mongodb database restore') as c:
         c.argument('account_name', account_name_type, id_part=None, required=True)
-        c.argument('database_name', options_list=['--name', '-n'], help="Database name", required=True)
-        c.argument('restore_timestamp', options_list=['--restore-timestamp', '-t'], action=UtcDatetimeAction, help="The timestamp to which the database needs to be restored to.", required=True)
+        c.argument('database_name', arg_type=required_name_type, help="Database name")
+        c.argument('restore_timestamp', arg_type=restore_timestamp_type, help="The timestamp to which the database needs to be restored to.")
 
     # MongoDB collection restore
     with self.argument_context('cosmosdb mongodb collection restore') as c:
         c.argument('account_name', account_name_type, id_part=None, required=True)
         c.argument('database_name', database_name_type, required=True)
-        c.argument('collection_name', options_list=['--name', '-n'], help="Collection name", required=True)
-        c.argument('restore_timestamp', options_list=['--restore-timestamp', '-t'], action=UtcDatetimeAction, help="The timestamp to which the collection needs to be restored to.", required=True)
+        c.argument('collection_name', arg_type=required_name_type, help="Collection name")
+        c.argument('restore_timestamp', arg_type=restore_timestamp_type, help="The timestamp to which the collection needs to be restored to.")